@@ -1,23 +1,28 @@
+import numpy as np
 import pandas as pd
-import torch
-from torchmetrics.regression import (
-    MeanSquaredError,
-    MeanAbsoluteError,
-    PearsonCorrCoef,
-    SpearmanCorrCoef,
-    R2Score,
-)
+from scipy.stats import rankdata
 
+from genbio.datasets.metrics import pearson
 
-def evaluate(preds: pd.DataFrame, targets: pd.DataFrame) -> dict[str, float]:
+
+def _as_labels(data) -> np.ndarray:
+    """Return the 'labels' column of a DataFrame, or the values of an array-like, as float64."""
+    if hasattr(data, 'columns'):
+        data = data['labels']
+    return np.asarray(data, dtype=np.float64)
+
+
+def evaluate(preds: pd.DataFrame | np.ndarray, targets: pd.DataFrame | np.ndarray) -> dict[str, float]:
     """Evaluate predictions against labels using multiple regression metrics.
 
     Note: 
         Primary metric is Spearman correlation.
     
     Args:
-        preds (pd.DataFrame): DataFrame containing model predictions with a 'labels' column in the same order as the targets.
-        targets (pd.DataFrame): DataFrame containing true labels with a 'labels' column.
+        preds (pd.DataFrame | np.ndarray): DataFrame containing model predictions with a 'labels' column in the same order as the targets,
+            or the predictions themselves as an array or Series. There is no need to copy the test DataFrame;
+            pd.DataFrame({'labels': preds_array}) is enough.
+        targets (pd.DataFrame | np.ndarray): DataFrame containing true labels with a 'labels' column, or the labels as an array or Series.
 
     Returns:
         dict[str, float]: A dictionary containing the following keys:
@@ -29,27 +34,26 @@ def evaluate(preds: pd.DataFrame, targets: pd.DataFrame) -> dict[str, float]:
             - rmse: Root Mean Squared Error
             - r2: R-squared score
     """
-    preds = torch.tensor(preds['labels'].to_numpy())
-    targets = torch.tensor(targets['labels'].to_numpy())
+    preds = _as_labels(preds)
+    targets = _as_labels(targets)
     assert len(preds) == len(targets), "Predictions and targets must have the same length."
 
-    MSE = MeanSquaredError()
-    MAE = MeanAbsoluteError()
-    Pearson = PearsonCorrCoef()
-    Spearman = SpearmanCorrCoef()
-    R2 = R2Score()
-
-    mse = MSE(preds, targets).item()
-    mae = MAE(preds, targets).item()
-    pearson = Pearson(preds, targets).item()
-    spearman = Spearman(preds, targets).item()
-    r2 = R2(preds, targets).item()
+    # Single pass over the residuals and centered targets
+    residuals = preds - targets
+    sq_residuals = residuals * residuals
+    dy = targets - targets.mean()
+
+    mse = float(sq_residuals.mean())
+    mae = float(np.abs(residuals).mean())
+    pearson_corr = pearson(preds, targets)
+    spearman = pearson(rankdata(preds), rankdata(targets))
+    r2 = float(1 - sq_residuals.sum() / (dy * dy).sum())
     rmse = mse ** 0.5
 
     return {
         'primary_metric': 'spearman',
         'spearman': spearman,
-        'pearson': pearson,
+        'pearson': pearson_corr,
         'mse': mse,
         'mae': mae,
         'rmse': rmse,
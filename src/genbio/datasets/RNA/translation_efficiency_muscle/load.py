@@ -1,5 +1,33 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from datasets import load_dataset
+from datasets import Dataset, load_dataset
+
+
+@lru_cache(maxsize=1)
+def _load_full() -> tuple[Dataset, dict[int, np.ndarray]]:
+    """Download the full dataset once per process.
+
+    Returns:
+        tuple: The Arrow-backed dataset and a mapping from fold ID to the row positions of that fold.
+    """
+    dataset = load_dataset(
+        "genbio-ai/rna-downstream-tasks",
+        "translation_efficiency_Muscle",
+        split="train",
+        download_mode="reuse_cache_if_exists",
+    )
+    folds = np.asarray(dataset.with_format("numpy")["fold_id"])
+    fold_positions = {int(fold): np.flatnonzero(folds == fold) for fold in np.unique(folds)}
+    return dataset, fold_positions
+
+
+def _to_pandas(dataset: Dataset, positions: np.ndarray) -> pd.DataFrame:
+    """Materialize only the selected rows as a DataFrame indexed by their original positions."""
+    df = dataset.select(positions).to_pandas()
+    df.index = positions
+    return df
 
 
 def load(fold_id: str) -> dict[str, pd.DataFrame]:
@@ -11,22 +39,19 @@ def load(fold_id: str) -> dict[str, pd.DataFrame]:
     Returns:
         dict[str, pd.DataFrame]: A dictionary keys 'train' and 'test', each containing DataFrames with columns 'sequence', 'labels', and 'fold_id'.
     """
-    # Download dataset from HuggingFace
-    dataset = load_dataset(
-        "genbio-ai/rna-downstream-tasks",
-        "translation_efficiency_Muscle",
-        split="train"
-    )
-
-    # Convert to pandas DataFrame
-    df = dataset.to_pandas()
+    # Download dataset from HuggingFace (cached after the first call)
+    dataset, fold_positions = _load_full()
 
-    # Filter to the specified fold
+    # Split on the precomputed fold positions, keeping the original row order
     fold_id = int(fold_id)
-    train_df = df[df['fold_id'] != fold_id]
-    test_df = df[df['fold_id'] == fold_id]
+    test_idx = fold_positions.get(fold_id, np.empty(0, dtype=np.intp))
+    train_idx = np.sort(np.concatenate(
+        [idx for fold, idx in fold_positions.items() if fold != fold_id]
+    ))
+    train_df = _to_pandas(dataset, train_idx)
+    test_df = _to_pandas(dataset, test_idx)
 
     return {
         "train": train_df,
         "test": test_df,
-    }
\ No newline at end of file
+    }
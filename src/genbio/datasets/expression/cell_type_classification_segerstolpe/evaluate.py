@@ -1,18 +1,67 @@
-import scanpy as sc
-from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+import anndata
+import numpy as np
 
+from genbio.datasets.metrics import HAS_NUMBA, NUMBA_MIN_SIZE, get_num_threads, prange, tjit
 
-def evaluate(preds: sc.AnnData, targets: sc.AnnData) -> dict[str, float]:
+
+N_CLASSES = 13
+
+
+@tjit(parallel=True)
+def _confusion_matrix_parallel(y_true: np.ndarray, y_pred: np.ndarray, n_classes: int, n_chunks: int) -> np.ndarray:
+    """Count label pairs into one partial matrix per chunk, then reduce, so threads never share a cell."""
+    n = y_true.shape[0]
+    step = (n + n_chunks - 1) // n_chunks
+    partial = np.zeros((n_chunks, n_classes, n_classes), dtype=np.int64)
+    for c in prange(n_chunks):
+        for i in range(c * step, min((c + 1) * step, n)):
+            partial[c, y_true[i], y_pred[i]] += 1
+    return partial.sum(axis=0)
+
+
+def _confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray, n_classes: int) -> np.ndarray:
+    """Build an (n_classes, n_classes) confusion matrix with rows as true labels."""
+    if HAS_NUMBA and len(y_true) >= NUMBA_MIN_SIZE:
+        return _confusion_matrix_parallel(y_true, y_pred, n_classes, get_num_threads())
+    flat = y_true.astype(np.intp) * n_classes + y_pred.astype(np.intp)
+    return np.bincount(flat, minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+
+
+def _as_labels(data: anndata.AnnData | np.ndarray, kind: str) -> np.ndarray:
+    """Return validated cell type labels from an AnnData's obs['cell_type_label'], or from an array, as int8."""
+    if hasattr(data, 'obs'):
+        data = data.obs['cell_type_label'].values
+    labels = np.asarray(data)
+    # Reject continuous or NaN labels before the int8 cast would silently truncate them
+    if not np.issubdtype(labels.dtype, np.integer):
+        integral = (
+            np.issubdtype(labels.dtype, np.floating)
+            and np.isfinite(labels).all()
+            and (labels == np.round(labels)).all()
+        )
+        if not integral:
+            raise ValueError(f"{kind} labels must be integers 0-{N_CLASSES - 1}, got dtype {labels.dtype} with non-integer values")
+    if labels.size and (labels.min() < 0 or labels.max() >= N_CLASSES):
+        raise ValueError(f"{kind} labels must be integers 0-{N_CLASSES - 1}")
+    return np.ascontiguousarray(labels, dtype=np.int8)
+
+
+def prepare_targets(targets: anndata.AnnData) -> np.ndarray:
+    """Extract the target labels once, so repeated evaluate() calls skip the AnnData lookup and cast."""
+    return _as_labels(targets, 'Target')
+
+
+def evaluate(preds: anndata.AnnData | np.ndarray, targets: anndata.AnnData | np.ndarray) -> dict[str, float]:
     """Evaluate cell type classification predictions for Segerstolpe dataset.
 
     Note:
         Primary metric is macro F1.
 
     Args:
-        preds (sc.AnnData): AnnData object containing predicted cell type labels
-            in preds.obs['cell_type_label']. Must contain integer labels 0-12.
-        targets (sc.AnnData): AnnData object containing true cell type labels
-            in targets.obs['cell_type_label']. Contains integer labels 0-12.
+        preds (anndata.AnnData | np.ndarray): AnnData object containing predicted cell type labels
+            in preds.obs['cell_type_label'], or the labels as an array. Must contain integer labels 0-12.
+        targets (anndata.AnnData | np.ndarray): AnnData object containing true cell type labels
+            in targets.obs['cell_type_label'], or the labels as an array. Contains integer labels 0-12.
 
     Returns:
         dict[str, float]: A dictionary containing the following keys:
@@ -24,18 +73,31 @@ def evaluate(preds: sc.AnnData, targets: sc.AnnData) -> dict[str, float]:
             - recall_macro: Macro-averaged recall
     """
     # Extract predictions and targets from the specific field used by Segerstolpe
-    y_pred = preds.obs['cell_type_label'].values
-    y_true = targets.obs['cell_type_label'].values
+    y_pred = _as_labels(preds, 'Predicted')
+    y_true = _as_labels(targets, 'Target')
 
     # Validate same length
     assert len(y_pred) == len(y_true), f"Predictions and targets must have the same length. Got {len(y_pred)} and {len(y_true)}"
 
-    # Calculate metrics
-    f1_macro = f1_score(y_true, y_pred, average='macro', zero_division=0)
-    f1_weighted = f1_score(y_true, y_pred, average='weighted', zero_division=0)
-    accuracy = accuracy_score(y_true, y_pred)
-    precision = precision_score(y_true, y_pred, average='macro', zero_division=0)
-    recall = recall_score(y_true, y_pred, average='macro', zero_division=0)
+    # All metrics are derived from a single confusion matrix
+    cm = _confusion_matrix(y_true, y_pred, N_CLASSES)
+    tp = np.diag(cm)
+    support = cm.sum(axis=1)
+    pred_pos = cm.sum(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(pred_pos > 0, tp / pred_pos, 0.0)
+        recall = np.where(support > 0, tp / support, 0.0)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+
+    # Macro averages cover classes seen in either targets or predictions
+    present = (support + pred_pos) > 0
+    n_samples = support.sum()
+    f1_macro = float(f1[present].mean()) if present.any() else 0.0
+    f1_weighted = float((f1 * support).sum() / n_samples) if n_samples else 0.0
+    accuracy = float(tp.sum() / n_samples) if n_samples else 0.0
+    precision = float(precision[present].mean()) if present.any() else 0.0
+    recall = float(recall[present].mean()) if present.any() else 0.0
 
     return {
         'primary_metric': 'f1_macro',
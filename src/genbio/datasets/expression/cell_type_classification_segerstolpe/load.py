@@ -1,14 +1,103 @@
-import scanpy as sc
+import anndata
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import urllib.request
+
+import h5py
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 TRAIN_URL = "https://huggingface.co/datasets/genbio-ai/cell-downstream-tasks/resolve/main/Segerstolpe/Segerstolpe_train.h5ad"
 TEST_URL = "https://huggingface.co/datasets/genbio-ai/cell-downstream-tasks/resolve/main/Segerstolpe/Segerstolpe_test.h5ad"
 CACHE_DIR = Path.home() / ".cache" / "genbio_leaderboard" / "Segerstolpe"
+CHUNK_SIZE = 1 << 20
+
+# Parsed h5ad files, keyed on path, so repeated load() calls skip the disk read
+_ADATA_CACHE: dict[Path, anndata.AnnData] = {}
+
+
+def _read_h5ad(path: Path) -> anndata.AnnData:
+    """Read an h5ad file once per process and return a fresh copy on each call."""
+    if path not in _ADATA_CACHE:
+        adata = anndata.read_h5ad(path)
+        # 13 classes fit in int8, an eighth of the default int64 footprint
+        adata.obs['cell_type_label'] = adata.obs['cell_type_label'].astype(np.int8)
+        _ADATA_CACHE[path] = adata
+    return _ADATA_CACHE[path].copy()
+
+
+class _LabelsOnly:
+    """Stand-in for an AnnData that only carries obs['cell_type_label'].
+
+    Accessing any other attribute (e.g. X) loads the full AnnData and delegates to it.
+    """
+
+    def __init__(self, path: Path, obs: pd.DataFrame):
+        self._path = path
+        self._full = None
+        self.obs = obs
 
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._full is None:
+            self._full = _read_h5ad(self._path)
+        return getattr(self._full, name)
 
-def load(fold_id: str) -> dict[str, sc.AnnData]:
+
+def _load_labels_only(path: Path) -> _LabelsOnly:
+    """Read only obs['cell_type_label'] from an h5ad file, without touching X."""
+    with h5py.File(path, "r") as f:
+        obs_group = f["obs"]
+        node = obs_group["cell_type_label"]
+        if isinstance(node, h5py.Group):
+            # Categorical encoding: integer codes into a categories array
+            labels = node["categories"][:][node["codes"][:]]
+        else:
+            labels = node[:]
+        obs_names = obs_group[obs_group.attrs["_index"]].asstr()[:]
+    obs = pd.DataFrame(
+        {"cell_type_label": np.asarray(labels, dtype=np.int8)},
+        index=pd.Index(obs_names),
+    )
+    return _LabelsOnly(path, obs)
+
+
+def _download(url: str, dest: Path) -> None:
+    """Stream url to dest, retrying on throttling and server errors.
+
+    The file is written to a uniquely named .part file next to dest and renamed into place on success,
+    so an interrupted download never leaves a truncated file at dest, and processes downloading into
+    a shared cache at the same time never write to the same file.
+    """
+    if dest.exists():
+        return
+    retry = Retry(total=5, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+    # A unique name opened exclusively; unlike tempfile.mkstemp this keeps umask permissions for other cache users
+    part_path = dest.with_name(f"{dest.name}.{uuid.uuid4().hex[:8]}.part")
+    try:
+        with open(part_path, "xb") as f, requests.Session() as session:
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+            with session.get(url, stream=True, timeout=(10, 60)) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    # Another process may have finished the same download first; keep its file
+    if dest.exists():
+        part_path.unlink()
+    else:
+        os.replace(part_path, dest)
+
+
+def load(fold_id: str, labels_only: bool = False) -> dict[str, anndata.AnnData | _LabelsOnly]:
     """Load the Segerstolpe pancreatic cell type classification dataset.
 
     The Segerstolpe dataset contains single-cell RNA-seq data from human pancreatic islets
@@ -16,15 +105,20 @@ def load(fold_id: str) -> dict[str, sc.AnnData]:
 
     Args:
         fold_id (str): Fold identifier. Must be "0" (only one split available).
+        labels_only (bool): If True, only read obs['cell_type_label'] from disk and return
+            stand-in objects instead of AnnData (they are not anndata.AnnData instances).
+            The full AnnData is loaded on first access to X or any other attribute.
+            Useful when only scoring predictions.
 
     Returns:
-        dict[str, sc.AnnData]: Dictionary with keys 'train' and 'test':
+        dict[str, anndata.AnnData | _LabelsOnly]: Dictionary with keys 'train' and 'test'
+            (AnnData objects, or labels-only stand-ins if labels_only is True):
             - train: AnnData with shape (1279, 19264) - 1,279 cells, 19,264 genes
             - test: AnnData with shape (427, 19264) - 427 cells, 19,264 genes
 
             Each AnnData object contains:
             - X: Gene expression matrix (cells × genes)
-            - obs['cell_type_label']: Integer labels 0-12 representing cell types
+            - obs['cell_type_label']: Integer labels 0-12 representing cell types, stored as int8
 
     Raises:
         ValueError: If fold_id is not "0"
@@ -38,21 +132,31 @@ def load(fold_id: str) -> dict[str, sc.AnnData]:
     train_path = CACHE_DIR / "Segerstolpe_train.h5ad"
     test_path = CACHE_DIR / "Segerstolpe_test.h5ad"
 
-    # Download train data if not cached
-    if not train_path.exists():
-        print(f"Downloading train data from {TRAIN_URL}...")
-        urllib.request.urlretrieve(TRAIN_URL, train_path)
-        print(f"Train data cached at {train_path}")
-
-    # Download test data if not cached
-    if not test_path.exists():
-        print(f"Downloading test data from {TEST_URL}...")
-        urllib.request.urlretrieve(TEST_URL, test_path)
-        print(f"Test data cached at {test_path}")
-
-    # Load data
-    train_adata = sc.read_h5ad(train_path)
-    test_adata = sc.read_h5ad(test_path)
+    # Download any files that are not cached yet, in parallel
+    missing = [
+        (split, url, path)
+        for split, url, path in (("train", TRAIN_URL, train_path), ("test", TEST_URL, test_path))
+        if not path.exists()
+    ]
+    if missing:
+        for split, url, _ in missing:
+            print(f"Downloading {split} data from {url}...")
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            futures = [executor.submit(_download, url, path) for _, url, path in missing]
+            for future in futures:
+                future.result()
+        for split, _, path in missing:
+            print(f"{split.capitalize()} data cached at {path}")
+
+    if labels_only:
+        return {
+            "train": _load_labels_only(train_path),
+            "test": _load_labels_only(test_path),
+        }
+
+    # Load data (cached after the first call)
+    train_adata = _read_h5ad(train_path)
+    test_adata = _read_h5ad(test_path)
 
     return {
         "train": train_adata,
@@ -0,0 +1,76 @@
+"""Metric helpers shared by the dataset evaluate modules.
+
+Numba is optional and only imported here, so modules that do not compute metrics
+(e.g. for describe()) never pay for it. Without Numba, tjit leaves functions as
+plain Python and the NumPy paths are used.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    from numba import get_num_threads, prange
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    prange = range
+    HAS_NUMBA = False
+
+    def get_num_threads():
+        return 1
+
+# Inputs at least this long take the Numba kernels when Numba is installed
+NUMBA_MIN_SIZE = 100_000
+
+
+def tjit(*args, **kwargs):
+    """Compile with numba.njit (cached on disk) if Numba is installed, else leave the function as is.
+
+    Usable bare (@tjit) or with numba.njit options (@tjit(parallel=True)).
+    """
+    if not HAS_NUMBA:
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    kwargs.setdefault('cache', True)
+    return numba.njit(*args, **kwargs)
+
+
+@tjit(parallel=True, error_model='numpy')
+def _pearson_parallel(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation as two parallel reductions (written out rather than using np.corrcoef)."""
+    n = x.shape[0]
+    sum_x = 0.0
+    sum_y = 0.0
+    for i in prange(n):
+        sum_x += x[i]
+        sum_y += y[i]
+    mean_x = sum_x / n
+    mean_y = sum_y / n
+    sxy = 0.0
+    sxx = 0.0
+    syy = 0.0
+    for i in prange(n):
+        dx = x[i] - mean_x
+        dy = y[i] - mean_y
+        sxy += dx * dy
+        sxx += dx * dx
+        syy += dy * dy
+    return sxy / np.sqrt(sxx * syy)
+
+
+def pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two 1-D float arrays.
+
+    Returns 0.0 when either input is constant, as torchmetrics' SpearmanCorrCoef did,
+    rather than NaN.
+    """
+    # Checked on the inputs: centering a constant array can leave rounding noise instead of zeros
+    if len(x) and (x.min() == x.max() or y.min() == y.max()):
+        return 0.0
+    if HAS_NUMBA and len(x) >= NUMBA_MIN_SIZE:
+        return float(_pearson_parallel(x, y))
+    dx = x - x.mean()
+    dy = y - y.mean()
+    return float((dx * dy).sum() / np.sqrt((dx * dx).sum() * (dy * dy).sum()))
+
@@ -1,14 +1,15 @@
 import yaml
 import numpy as np
 import pandas as pd
+import ast
 import importlib
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 from pathlib import Path
 import json
 
-
 def _get_datasets_dir():
     """Get the path to the datasets directory."""
     # Assume datasets directory is at the root of the repository
@@ -20,21 +21,43 @@ def _get_datasets_dir():
     return project_root.resolve()
 
 
+@lru_cache(maxsize=None)
 def _load_dataset_module(dataset_name, module_name):
-    """Dynamically load a module from the datasets directory."""
-    # datasets_dir = _get_datasets_dir()
+    """Dynamically load a module from the datasets directory.
+
+    Modules are imported through the regular import system, so each one is
+    executed at most once per process.
+    """
+    dataset_module_name = dataset_name.replace('/', '.').replace('-', '_')
+    full_name = f"genbio.datasets.{dataset_module_name}.{module_name}"
+
+    try:
+        return importlib.import_module(full_name)
+    except ModuleNotFoundError as e:
+        if e.name is not None and full_name.startswith(e.name):
+            raise FileNotFoundError(f"Module not found: {full_name}") from e
+        raise
+
+
+@lru_cache(maxsize=None)
+def _get_function_doc(dataset_name, module_name, function_name):
+    """Read a function's docstring from a dataset module's source, without importing the module.
+
+    Returns None if the module, the function, or its docstring is missing.
+    """
     dataset_module_name = dataset_name.replace('/', '.').replace('-', '_')
     package_name = f"genbio.datasets.{dataset_module_name}"
 
-    # Build the path to the module file
-    with resources.path(package_name, f"{module_name}.py") as module_path:
-        if not module_path.exists():
-            raise FileNotFoundError(f"Module not found: {module_path}")
-
-        spec = importlib.util.spec_from_file_location(
-            f"{package_name}.{module_name}",
-            module_path
-        )
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
+    try:
+        source = (resources.files(package_name) / f"{module_name}.py").read_text()
+    except (ModuleNotFoundError, FileNotFoundError):
+        return None
+    tree = ast.parse(source)
+    return next(
+        (
+            ast.get_docstring(node)
+            for node in tree.body
+            if isinstance(node, ast.FunctionDef) and node.name == function_name
+        ),
+        None,
+    )
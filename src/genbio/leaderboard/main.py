@@ -1,4 +1,4 @@
-from genbio.datasets.utils import _get_datasets_dir, _load_dataset_module
+from genbio.datasets.utils import _get_datasets_dir, _get_function_doc, _load_dataset_module
 from genbio.leaderboard import reporting
 from pathlib import Path
 
@@ -16,6 +16,11 @@ class BenchmarkTask:
         module = _load_dataset_module(self.name, 'load')
         data = module.load(self.fold)
         self._test_data = data['test']
+
+        # Datasets may precompute what evaluate() needs from the test set, for reuse across submissions
+        evaluate_module = _load_dataset_module(self.name, 'evaluate')
+        prepare_targets = getattr(evaluate_module, 'prepare_targets', None)
+        self._test_targets = prepare_targets(data['test']) if prepare_targets else data['test']
         return data['train'], data['test']
 
     def evaluate(self, preds, targets):
@@ -35,6 +40,8 @@ class BenchmarkTask:
     def submit(self, preds, name=None, description=None) -> None:
         """Calls evaluate(preds, _test_data) and submits the results.
 
+        The targets are the test data as prepared once in setup(), if the dataset defines prepare_targets().
+
         Note:
             If preds is identical to _test_data, it will be logged as a dummy submission.
 
@@ -54,7 +61,7 @@ class BenchmarkTask:
         if description is None:
             description = "No description provided"
         module = _load_dataset_module(self.name, 'evaluate')
-        results = module.evaluate(preds, self._test_data)
+        results = module.evaluate(preds, self._test_targets)
 
         if preds is self._test_data:
             print("> Logging as dummy submission (submission data matches test data)")
@@ -94,29 +101,27 @@ def describe(task: BenchmarkTask) -> None:
 
     # Print README
     try:
-        with open(readme_path, 'r') as f:
-            readme_content = f.read()
-        print(readme_content)
+        print(readme_path.read_text())
     except FileNotFoundError:
         print(f"No README.md found for dataset: {task.name}")
 
-    # Print load() documentation
-    load_module = _load_dataset_module(task.name, 'load')
-    if hasattr(load_module, 'load') and load_module.load.__doc__:
+    # Print load() documentation, read from source so the dataset's dependencies are not imported
+    load_doc = _get_function_doc(task.name, 'load', 'load')
+    if load_doc:
         print(f"\n{'='*80}")
         print(f"load() function documentation for {task.name}:")
         print("=" * 80)
-        print(load_module.load.__doc__)
+        print(load_doc)
     else:
         print(f"\nNo documentation found for load() function in dataset: {task.name}")
 
     # Print evaluate() documentation
-    evaluate_module = _load_dataset_module(task.name, 'evaluate')
-    if hasattr(evaluate_module, 'evaluate') and evaluate_module.evaluate.__doc__:
+    evaluate_doc = _get_function_doc(task.name, 'evaluate', 'evaluate')
+    if evaluate_doc:
         print(f"\n{'='*80}")
         print(f"evaluate(preds, targets) function documentation for {task.name}:")
         print("=" * 80)
-        print(evaluate_module.evaluate.__doc__)
+        print(evaluate_doc)
     else:
         print(f"\nNo documentation found for evaluate() function in dataset: {task.name}")
 
@@ -2,18 +2,273 @@
 
 import argparse
 import json
+import math
+import numbers
+import os
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Union
 import pandas as pd
 
-
-# Submission directory path
-SUBMISSION_DIR = Path(__file__).parent.parent.parent.parent / "submissions" 
+try:
+    import orjson
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written with the stdlib json module may contain NaN or Infinity, which orjson rejects
+            return json.loads(data)
+
+    def _dumps(obj, indent: bool = True) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj, indent: bool = True) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+# Submission directory path, laid out as SUBMISSION_DIR / dataset / fold / user / <submission>.json
+SUBMISSION_DIR = Path(__file__).parent.parent.parent.parent / "submissions"
+
+# Location of submissions under the original, nested layout
+_V1_SUBDIR = Path("genbio-leaderboard") / "submissions"
+
+# Submission index, derived from the JSON files and rebuilt when the schema version changes
+# or a queried dataset/fold's directories no longer match the modification times recorded in fold_state
+INDEX_FILENAME = "index.sqlite"
+_INDEX_VERSION = 4
+_INDEX_SCHEMA = """
+CREATE TABLE submissions (
+    dataset TEXT NOT NULL,
+    fold TEXT NOT NULL,
+    user TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    timestamp_ns INTEGER NOT NULL,
+    name TEXT,
+    description TEXT,
+    score REAL,
+    metrics TEXT NOT NULL
+);
+CREATE INDEX submissions_dataset_fold_user ON submissions (dataset, fold, user);
+CREATE TABLE fold_state (
+    dataset TEXT NOT NULL,
+    fold TEXT NOT NULL,
+    dir_mtimes TEXT NOT NULL,
+    PRIMARY KEY (dataset, fold)
+);
+"""
+
+# Submission fields exported ahead of the per-metric columns
+EXPORT_COLUMNS = ['dataset', 'fold', 'user', 'timestamp', 'name', 'description']
 
 
 # Storage functions
 
+def _iter_json(root: Union[str, Path]) -> Iterator[str]:
+    """Yield the paths of all JSON files below root.
+
+    Uses os.scandir, whose entries carry the file type from the directory listing,
+    so no extra stat call is made per entry. Symlinked directories are not followed.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_json(entry.path)
+            elif entry.name.endswith(".json"):
+                yield entry.path
+
+
+def _fold_dir_mtimes(dataset: str, fold: str) -> Dict[str, int]:
+    """Modification times of a dataset/fold directory and its user directories, keyed by name ('.' for the fold).
+
+    Adding or deleting a submission file changes its user directory's mtime, and adding a user changes
+    the fold directory's, so these catch hand edits with one stat per user rather than per file.
+    Edits to a file's contents in place are not seen; run reindex after those.
+    """
+    fold_dir = SUBMISSION_DIR / dataset / fold
+    try:
+        mtimes = {'.': fold_dir.stat().st_mtime_ns}
+        with os.scandir(fold_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    mtimes[entry.name] = entry.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return mtimes
+
+
+def _record_fold_state(conn: sqlite3.Connection, dataset: str, fold: str) -> None:
+    """Store the current directory modification times of a dataset/fold in the index."""
+    conn.execute(
+        "INSERT OR REPLACE INTO fold_state VALUES (?, ?, ?)",
+        (dataset, fold, _dumps(_fold_dir_mtimes(dataset, fold), indent=False).decode()),
+    )
+
+
+def _read_json(path: Union[str, Path]) -> Dict:
+    """Parse a submission JSON file."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _read_json_files(paths: List[Union[str, Path]]) -> List[Dict]:
+    """Parse many submission JSON files concurrently, preserving order."""
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_read_json, paths))
+
+
+def _timestamp_ns(submission: Dict) -> int:
+    """Submission time in nanoseconds since the epoch, derived from the ISO timestamp for older submissions."""
+    if 'timestamp_ns' in submission:
+        return submission['timestamp_ns']
+    timestamp = datetime.fromisoformat(submission['timestamp'])
+    return round(timestamp.timestamp() * 1_000_000) * 1_000
+
+
+def _finite_metrics(metrics: Dict) -> Dict:
+    """Replace NaN and infinite metric values with None, so both JSON backends write them as null."""
+    return {
+        key: None if isinstance(value, numbers.Real) and not math.isfinite(value) else value
+        for key, value in metrics.items()
+    }
+
+
+def _index_row(submission: Dict) -> tuple:
+    """Flatten a submission dictionary into a row of the submissions index."""
+    metrics = _finite_metrics(submission['metrics'])
+    return (
+        submission['dataset'],
+        submission['fold'],
+        submission['user'],
+        submission['timestamp'],
+        _timestamp_ns(submission),
+        submission.get('name'),
+        submission.get('description'),
+        metrics.get(metrics.get('primary_metric')),
+        _dumps(metrics, indent=False).decode(),
+    )
+
+
+def _insert_index_rows(conn: sqlite3.Connection, submissions: List[Dict]) -> None:
+    conn.executemany(
+        "INSERT INTO submissions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [_index_row(submission) for submission in submissions],
+    )
+
+
+def _migrate_v1_layout() -> None:
+    """Move submissions from the nested genbio-leaderboard/submissions layout up into SUBMISSION_DIR.
+
+    Called by _connect_index while holding the index write lock.
+    """
+    v1_dir = SUBMISSION_DIR / _V1_SUBDIR
+    if not v1_dir.exists():
+        return
+    for filepath in list(_iter_json(v1_dir)):
+        destination = SUBMISSION_DIR / os.path.relpath(filepath, v1_dir)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(filepath, destination)
+        except FileNotFoundError:
+            # Already moved by a process that does not share the lock, e.g. an older version
+            pass
+    # Remove the emptied directories, deepest first
+    for dirpath, _, _ in sorted(os.walk(SUBMISSION_DIR / _V1_SUBDIR.parts[0]), reverse=True):
+        try:
+            os.rmdir(dirpath)
+        except OSError:
+            pass
+
+
+def _has_v1_files() -> bool:
+    """Whether any submission files remain in the v1 layout, checked without taking the index lock."""
+    try:
+        return next(_iter_json(SUBMISSION_DIR / _V1_SUBDIR), None) is not None
+    except FileNotFoundError:
+        # Missing, or a directory was removed mid-walk while another process migrates it
+        return (SUBMISSION_DIR / _V1_SUBDIR).exists()
+
+
+def _rebuild_index(conn: sqlite3.Connection, folds: List[tuple]) -> None:
+    """Recreate the submissions index from the JSON files on disk.
+
+    Directory state is recorded for every dataset/fold with submissions, plus the given (dataset, fold) pairs.
+    """
+    submissions = _read_json_files(list(_iter_json(SUBMISSION_DIR)))
+    conn.execute("DROP TABLE IF EXISTS submissions")
+    conn.execute("DROP TABLE IF EXISTS fold_state")
+    for statement in _INDEX_SCHEMA.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+    _insert_index_rows(conn, submissions)
+    for dataset, fold in set(folds) | {(submission['dataset'], submission['fold']) for submission in submissions}:
+        _record_fold_state(conn, dataset, fold)
+    conn.execute(f"PRAGMA user_version = {_INDEX_VERSION}")
+
+
+def _index_is_current(conn: sqlite3.Connection, dataset: Optional[str], fold: Optional[str]) -> bool:
+    """Whether the index has the current schema and, if given, matches the dataset/fold directories on disk."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _INDEX_VERSION:
+        return False
+    if dataset is None:
+        return True
+    row = conn.execute("SELECT dir_mtimes FROM fold_state WHERE dataset = ? AND fold = ?", (dataset, fold)).fetchone()
+    return (_loads(row["dir_mtimes"]) if row else {}) == _fold_dir_mtimes(dataset, fold)
+
+
+def _connect_index(
+    dataset: Optional[str] = None,
+    fold: Optional[str] = None,
+    rebuild: bool = False,
+) -> sqlite3.Connection:
+    """Open the submissions index, building it from the JSON files if it is missing or stale.
+
+    Only the given dataset/fold is checked for staleness, so a query costs one stat per user of that
+    fold however many submissions other datasets hold. Setting rebuild forces a rebuild regardless.
+    """
+    SUBMISSION_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(SUBMISSION_DIR / INDEX_FILENAME, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    v1_layout = _has_v1_files()
+    if rebuild or v1_layout or not _index_is_current(conn, dataset, fold):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Migrate and re-check under the write lock, in case another process got there first
+            if v1_layout:
+                _migrate_v1_layout()
+            if rebuild or not _index_is_current(conn, dataset, fold):
+                _rebuild_index(conn, [(dataset, fold)] if dataset is not None else [])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            conn.close()
+            raise
+    return conn
+
+
+def _row_to_submission(row: sqlite3.Row) -> Dict:
+    """Convert a submissions index row back into a submission dictionary."""
+    return {
+        "timestamp": row["timestamp"],
+        "timestamp_ns": row["timestamp_ns"],
+        "user": row["user"],
+        "dataset": row["dataset"],
+        "fold": row["fold"],
+        "metrics": _loads(row["metrics"]),
+        "name": row["name"],
+        "description": row["description"],
+    }
+
+
 def save_submission(
     dataset: str,
     fold: str,
@@ -23,7 +278,7 @@ def save_submission(
     description: str,
 ) -> str:
     """
-    Save a submission to disk.
+    Save a submission to disk and record it in the submissions index.
 
     Args:
         dataset: Dataset name
@@ -36,30 +291,43 @@ def save_submission(
     Returns:
         Path to the saved submission file
     """
-    # Create directory structure
-    submission_dir = SUBMISSION_DIR / "genbio-leaderboard/submissions" / dataset / fold / user
-    submission_dir.mkdir(parents=True, exist_ok=True)
+    submission_dir = SUBMISSION_DIR / dataset / fold / user
 
-    # Create timestamp
-    timestamp = datetime.now().isoformat()
+    # Create timestamp; the ISO form is kept for display
+    timestamp_ns = time.time_ns()
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    timestamp = datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1_000).isoformat()
 
     # Create submission data
     submission_data = {
         "timestamp": timestamp,
+        "timestamp_ns": timestamp_ns,
         "user": user,
         "dataset": dataset,
         "fold": fold,
-        "metrics": metrics,
+        "metrics": _finite_metrics(metrics),
         "name": name,
         "description": description,
     }
 
-    # Save to file
-    filename = f"{timestamp.replace(':', '-')}.json"
+    # Save to file; the random suffix keeps concurrent submissions from colliding
+    filename = f"{timestamp_ns}-{uuid.uuid4().hex[:8]}.json"
     filepath = submission_dir / filename
 
-    with open(filepath, 'w') as f:
-        json.dump(submission_data, f, indent=2)
+    # Open the index before writing, so a first-time rebuild cannot pick up this file twice. The directories,
+    # file and index row are written in one transaction, and the file is removed again if any step fails.
+    with closing(_connect_index(dataset, fold)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            submission_dir.mkdir(parents=True, exist_ok=True)
+            filepath.write_bytes(_dumps(submission_data))
+            _insert_index_rows(conn, [submission_data])
+            _record_fold_state(conn, dataset, fold)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            filepath.unlink(missing_ok=True)
+            raise
 
     return str(filepath)
 
@@ -68,6 +336,7 @@ def load_submissions(
     dataset: str,
     fold: str,
     user: Optional[str] = None,
+    since: Optional[str] = None,
 ) -> List[Dict]:
     """
     Load submissions from disk.
@@ -76,71 +345,73 @@ def load_submissions(
         dataset: Dataset name
         fold: Fold identifier
         user: Optional user identifier. If None, load all users.
+        since: Optional ISO timestamp. If given, only load submissions made at or after it.
 
     Returns:
         List of submission dictionaries
     """
-    submissions = []
-
-    base_dir = Path(SUBMISSION_DIR) / "genbio-leaderboard/submissions" / dataset / fold
-
-    if not base_dir.exists():
-        return submissions
+    if not SUBMISSION_DIR.exists():
+        return []
 
+    query = "SELECT * FROM submissions WHERE dataset = ? AND fold = ?"
+    params = [dataset, fold]
     if user:
-        # Load submissions for specific user
-        user_dir = base_dir / user
-        if user_dir.exists():
-            for filepath in user_dir.glob("*.json"):
-                with open(filepath, 'r') as f:
-                    submissions.append(json.load(f))
-    else:
-        # Load submissions for all users
-        for user_dir in base_dir.iterdir():
-            if user_dir.is_dir():
-                for filepath in user_dir.glob("*.json"):
-                    with open(filepath, 'r') as f:
-                        submissions.append(json.load(f))
-
+        query += " AND user = ?"
+        params.append(user)
+    if since:
+        query += " AND timestamp >= ?"
+        params.append(since)
     # Sort by timestamp
-    submissions.sort(key=lambda x: x['timestamp'])
+    query += " ORDER BY timestamp_ns"
 
-    return submissions
+    with closing(_connect_index(dataset, fold)) as conn:
+        return [_row_to_submission(row) for row in conn.execute(query, params)]
 
 
-def get_leaderboard_data(dataset: str, fold: str) -> List[Dict]:
+def get_leaderboard_data(dataset: str, fold: str, since: Optional[str] = None) -> List[Dict]:
     """
     Get leaderboard data (best submission per user).
 
     Args:
         dataset: Dataset name
         fold: Fold identifier
+        since: Optional ISO timestamp. If given, only consider submissions made at or after it.
 
     Returns:
         List of best submissions per user, sorted by primary metric
     """
-    all_submissions = load_submissions(dataset, fold)
-
-    if not all_submissions:
+    if not SUBMISSION_DIR.exists():
         return []
 
-    # Get primary metric name
-    primary_metric = all_submissions[0]['metrics']['primary_metric']
+    # Rank each user's submissions by primary metric (the earliest one on ties) and keep the best
+    where = "dataset = ? AND fold = ?"
+    params = [dataset, fold]
+    if since:
+        where += " AND timestamp >= ?"
+        params.append(since)
+    query = f"""
+        SELECT * FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY user ORDER BY score DESC, timestamp_ns) AS user_rank
+            FROM submissions
+            WHERE {where}
+        )
+        WHERE user_rank = 1
+        ORDER BY score DESC, timestamp_ns
+    """
 
-    # Group by user and get best submission
-    user_best = {}
-    for submission in all_submissions:
-        user = submission['user']
-        metric_value = submission['metrics'][primary_metric]
+    with closing(_connect_index(dataset, fold)) as conn:
+        return [_row_to_submission(row) for row in conn.execute(query, params)]
 
-        if user not in user_best or metric_value > user_best[user]['metrics'][primary_metric]:
-            user_best[user] = submission
 
-    # Convert to list and sort by primary metric (descending)
-    leaderboard = list(user_best.values())
-    leaderboard.sort(key=lambda x: x['metrics'][primary_metric], reverse=True)
+def reindex() -> int:
+    """
+    Rebuild the submissions index from the JSON files on disk.
 
-    return leaderboard
+    Returns:
+        Number of submissions indexed
+    """
+    with closing(_connect_index(rebuild=True)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM submissions").fetchone()[0]
 
 
 def get_user_history(dataset: str, fold: str, user: str) -> List[Dict]:
@@ -160,6 +431,17 @@ def get_user_history(dataset: str, fold: str, user: str) -> List[Dict]:
 
 # Display functions
 
+def _format_changes(scores: pd.Series) -> pd.Series:
+    """Format score changes between consecutive submissions, showing '--' for the first or no change."""
+    changes = scores.diff()
+    return changes.map('{:+.4f}'.format).where(changes.notna() & (changes != 0), '--')
+
+
+def _format_score(value: float, spec: str = '.6f') -> str:
+    """Format a score, showing '--' for a missing (None or NaN) one."""
+    return '--' if pd.isna(value) else format(value, spec)
+
+
 def display_leaderboard(dataset: str, fold: str):
     """Display the leaderboard for the specified dataset and fold."""
     # Get leaderboard data
@@ -173,23 +455,21 @@ def display_leaderboard(dataset: str, fold: str):
     # Get primary metric name
     primary_metric = leaderboard_data[0]['metrics']['primary_metric']
 
-    # Print header
+    # Collect entries into columns once, then format the whole table at once
+    table = pd.DataFrame({
+        'Rank': range(1, len(leaderboard_data) + 1),
+        'User': [entry['user'] for entry in leaderboard_data],
+        'Name': [entry.get('name') or 'Unnamed' for entry in leaderboard_data],  # Handle old submissions without name
+        'Score': pd.to_numeric([entry['metrics'][primary_metric] for entry in leaderboard_data], errors='coerce'),
+        'Timestamp': [entry['timestamp'][:19] for entry in leaderboard_data],  # Remove microseconds
+    })
+
+    # Print header and entries
     print(f"\n{'='*100}")
     print(f"Leaderboard: {dataset} (Fold {fold})")
     print(f"Primary Metric: {primary_metric}")
     print(f"{'='*100}")
-    print(f"{'Rank':<6} {'User':<20} {'Name':<25} {'Score':<12} {'Timestamp':<30}")
-    print(f"{'-'*100}")
-
-    # Print entries
-    for rank, entry in enumerate(leaderboard_data, 1):
-        user = entry['user']
-        name = entry.get('name', 'Unnamed')  # Handle old submissions without name
-        score = entry['metrics'][primary_metric]
-        timestamp = entry['timestamp'][:19]  # Remove microseconds
-
-        print(f"{rank:<6} {user:<20} {name:<25} {score:<12.6f} {timestamp:<30}")
-
+    print(table.to_string(index=False, formatters={'Score': _format_score}))
     print(f"{'='*100}\n")
 
 
@@ -205,52 +485,47 @@ def display_history(dataset: str, fold: str, user: str):
     # Get primary metric name
     primary_metric = user_submissions[0]['metrics']['primary_metric']
 
-    # Print header
+    # One column per metric, with the primary metric first and the change between submissions next to it;
+    # missing values (stored as null) become NaN so the columns stay numeric
+    metrics = pd.DataFrame([submission['metrics'] for submission in user_submissions])
+    metrics = metrics.drop(columns='primary_metric').apply(pd.to_numeric, errors='coerce')
+    scores = metrics[primary_metric]
+    other_metrics = metrics.drop(columns=primary_metric)
+    table = pd.concat([
+        pd.DataFrame({
+            '#': range(1, len(user_submissions) + 1),
+            'Name': [submission.get('name') or 'Unnamed' for submission in user_submissions],  # Handle old submissions without name
+            'Timestamp': [submission['timestamp'][:19] for submission in user_submissions],  # Remove microseconds
+            primary_metric: scores,
+            'Change': _format_changes(scores),
+        }),
+        other_metrics,
+    ], axis=1)
+
+    # Print header and entries
     print(f"\n{'='*120}")
     print(f"Submission History: {user} - {dataset} (Fold {fold})")
     print(f"Primary Metric: {primary_metric}")
     print(f"{'='*120}")
-    print(f"{'#':<4} {'Name':<25} {'Timestamp':<22} {primary_metric:<12} {'Change':<10} {'Other Metrics'}")
-    print(f"{'-'*120}")
-
-    # Print entries
-    prev_score = None
-    for idx, submission in enumerate(user_submissions, 1):
-        name = submission.get('name', 'Unnamed')  # Handle old submissions without name
-        timestamp = submission['timestamp'][:19]  # Remove microseconds
-        score = submission['metrics'][primary_metric]
-
-        # Calculate change
-        if prev_score is not None:
-            change = score - prev_score
-            change_str = f"{change:+.4f}" if change != 0 else "  --"
-        else:
-            change_str = "  --"
-
-        # Format other metrics
-        other_metrics = []
-        for key, value in submission['metrics'].items():
-            if key not in ['primary_metric', primary_metric]:
-                other_metrics.append(f"{key}={value:.4f}")
-        other_metrics_str = ", ".join(other_metrics)
-
-        print(f"{idx:<4} {name:<25} {timestamp:<22} {score:<12.6f} {change_str:<10} {other_metrics_str}")
-
-        prev_score = score
-
+    print(table.to_string(
+        index=False,
+        float_format='{:.4f}'.format,
+        formatters={primary_metric: _format_score},
+        na_rep='--',
+    ))
     print(f"{'='*120}")
 
     # Show improvement summary
     if len(user_submissions) > 1:
-        first_score = user_submissions[0]['metrics'][primary_metric]
-        best_score = max(s['metrics'][primary_metric] for s in user_submissions)
-        latest_score = user_submissions[-1]['metrics'][primary_metric]
+        first_score = scores.iloc[0]
+        best_score = scores.max()
+        latest_score = scores.iloc[-1]
 
         print(f"\nSummary:")
-        print(f"  First submission:  {first_score:.6f}")
-        print(f"  Best submission:   {best_score:.6f}")
-        print(f"  Latest submission: {latest_score:.6f}")
-        print(f"  Total improvement: {latest_score - first_score:+.6f}")
+        print(f"  First submission:  {_format_score(first_score)}")
+        print(f"  Best submission:   {_format_score(best_score)}")
+        print(f"  Latest submission: {_format_score(latest_score)}")
+        print(f"  Total improvement: {_format_score(latest_score - first_score, '+.6f')}")
         print()
 
 
@@ -268,35 +543,36 @@ def export_benchmark_data(
     Returns:
         Path to the exported CSV file
     """
-    base_dir = SUBMISSION_DIR / "genbio-leaderboard/submissions"
-
-    if not base_dir.exists():
-        raise ValueError(f"Submissions directory not found: {base_dir}")
-
-    # Find all submission JSON files recursively
-    all_submissions = []
-    for submission_file in base_dir.glob("**/*.json"):
-        with open(submission_file, 'r') as f:
-            submission = json.load(f)
-            # Flatten metrics into top-level fields
-            flat_submission = {
-                'dataset': submission['dataset'],
-                'fold': submission['fold'],
-                'user': submission['user'],
-                'timestamp': submission['timestamp'],
-                'name': submission.get('name', ''),
-                'description': submission.get('description', ''),
-            }
-            # Add all metrics as separate columns
-            for key, value in submission['metrics'].items():
-                flat_submission[f'metric_{key}'] = value
-            all_submissions.append(flat_submission)
-
-    if not all_submissions:
+    if not SUBMISSION_DIR.exists():
+        raise ValueError(f"Submissions directory not found: {SUBMISSION_DIR}")
+    # Opening the index migrates any files still in the v1 layout
+    _connect_index().close()
+
+    # Find and parse all submission JSON files
+    submissions = _read_json_files(list(_iter_json(SUBMISSION_DIR)))
+
+    if not submissions:
         raise ValueError("No submissions found to export")
 
+    # Flatten metrics into top-level fields, one column per metric
+    metric_keys = list(dict.fromkeys(
+        key for submission in submissions for key in submission['metrics']
+    ))
+    rows = [
+        (
+            submission['dataset'],
+            submission['fold'],
+            submission['user'],
+            submission['timestamp'],
+            submission.get('name', ''),
+            submission.get('description', ''),
+            *(submission['metrics'].get(key) for key in metric_keys),
+        )
+        for submission in submissions
+    ]
+
     # Create DataFrame and sort by timestamp
-    df = pd.DataFrame(all_submissions)
+    df = pd.DataFrame.from_records(rows, columns=EXPORT_COLUMNS + [f'metric_{key}' for key in metric_keys])
     df = df.sort_values('timestamp')
     df.to_csv(output_file, index=False)
     return output_file
@@ -328,6 +604,8 @@ def cli():
         default='benchmark_export.csv',
         help='Output CSV filename (default: benchmark_export.csv)'
     )
+    # Reindex command
+    subparsers.add_parser('reindex', help='Rebuild the submissions index from the submission files')
 
     args = parser.parse_args()
     if args.command == 'leaderboard':
@@ -339,5 +617,7 @@ def cli():
             output_file=args.output,
         )
         print(f"\nBenchmark data successfully exported to: {output_file}")
+    elif args.command == 'reindex':
+        print(f"\nIndexed {reindex()} submissions")
     else:
         parser.print_help()
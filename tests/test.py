@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import genbio.leaderboard as gl
 
 # Select a dataset and fold, and provide a username
@@ -11,10 +13,8 @@ train_df, test_df = task.setup()
 
 # Build your model, make predictions
 mean_pred = train_df['labels'].mean()
-train_pred_df = train_df.copy()
-train_pred_df['labels'] = mean_pred
-test_pred_df = test_df.copy()
-test_pred_df['labels'] = mean_pred
+train_pred_df = pd.DataFrame({'labels': np.full(len(train_df), mean_pred)})
+test_pred_df = pd.DataFrame({'labels': np.full(len(test_df), mean_pred)})
 
 # Compute intermediate train metrics
 task.evaluate(train_pred_df, train_df)
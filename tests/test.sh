@@ -5,4 +5,7 @@ genbio-leaderboard leaderboard --dataset RNA/translation-efficiency-muscle --fol
 genbio-leaderboard history --dataset RNA/translation-efficiency-muscle --fold 0 --user caleb.ellington
 
 # Export benchmark data to CSV
-genbio-leaderboard export --output benchmark_data.csv
\ No newline at end of file
+genbio-leaderboard export --output benchmark_data.csv
+
+# Rebuild the submissions index from the submission files
+genbio-leaderboard reindex
\ No newline at end of file
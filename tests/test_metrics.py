@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+import genbio.datasets.metrics as metrics
+import genbio.datasets.expression.cell_type_classification_segerstolpe.evaluate as segerstolpe
+import genbio.datasets.RNA.translation_efficiency_pc3.evaluate as pc3
+
+# scikit-learn is only a test dependency, unlike scipy
+skm = pytest.importorskip('sklearn.metrics')
+
+
+@pytest.fixture(params=['numpy', 'numba'])
+def backend(request, monkeypatch):
+    """Run each test once on the NumPy path and once with the Numba kernels forced on."""
+    if request.param == 'numba':
+        if not metrics.HAS_NUMBA:
+            pytest.skip('numba not installed')
+        monkeypatch.setattr(metrics, 'NUMBA_MIN_SIZE', 0)
+        monkeypatch.setattr(segerstolpe, 'NUMBA_MIN_SIZE', 0)
+    return request.param
+
+
+def _regression_inputs():
+    rng = np.random.default_rng(0)
+    targets = rng.normal(size=500)
+    return {
+        'random': (rng.normal(size=500), targets),
+        'ties': (np.round(rng.normal(size=500), 1), np.round(targets, 1)),
+    }
+
+
+@pytest.mark.parametrize('case', ['random', 'ties'])
+def test_regression_matches_reference(backend, case):
+    preds, targets = _regression_inputs()[case]
+    result = pc3.evaluate(preds, targets)
+    assert result['spearman'] == pytest.approx(stats.spearmanr(preds, targets).statistic)
+    assert result['pearson'] == pytest.approx(stats.pearsonr(preds, targets).statistic)
+    assert result['mse'] == pytest.approx(skm.mean_squared_error(targets, preds))
+    assert result['mae'] == pytest.approx(skm.mean_absolute_error(targets, preds))
+    assert result['r2'] == pytest.approx(skm.r2_score(targets, preds))
+
+
+def test_regression_constant_predictions(backend):
+    targets = np.random.default_rng(1).normal(size=500)
+    with np.errstate(all='raise'):
+        result = pc3.evaluate(np.full(500, targets.mean()), targets)
+    assert result['spearman'] == 0.0
+    assert result['pearson'] == 0.0
+
+
+def _classification_inputs():
+    rng = np.random.default_rng(3)
+    y_true = rng.integers(0, 13, size=2000)
+    return {
+        'random': (rng.integers(0, 13, size=2000), y_true),
+        # Class 12 never occurs, class 11 only in predictions, class 10 only in targets
+        'absent': (np.where(y_true == 10, 0, np.minimum(y_true, 11)), np.minimum(y_true, 10)),
+    }
+
+
+@pytest.mark.parametrize('case', ['random', 'absent'])
+def test_classification_matches_sklearn(backend, case):
+    y_pred, y_true = _classification_inputs()[case]
+    result = segerstolpe.evaluate(y_pred, y_true)
+    assert result['f1_macro'] == pytest.approx(skm.f1_score(y_true, y_pred, average='macro', zero_division=0))
+    assert result['f1_weighted'] == pytest.approx(skm.f1_score(y_true, y_pred, average='weighted', zero_division=0))
+    assert result['accuracy'] == pytest.approx(skm.accuracy_score(y_true, y_pred))
+    assert result['precision_macro'] == pytest.approx(skm.precision_score(y_true, y_pred, average='macro', zero_division=0))
+    assert result['recall_macro'] == pytest.approx(skm.recall_score(y_true, y_pred, average='macro', zero_division=0))
+
+
+def test_classification_rejects_out_of_range_labels():
+    with pytest.raises(ValueError):
+        segerstolpe.evaluate(np.array([0, 13]), np.array([0, 1]))
+
+
+@pytest.mark.parametrize('preds', [
+    np.array([0.9, 1.5, 2.2, 3.99]),
+    np.array([0.0, 1.0, np.nan, 3.0]),
+    np.array([0.0, 1.0, np.inf, 3.0]),
+])
+def test_classification_rejects_non_integral_labels(preds):
+    with pytest.raises(ValueError):
+        segerstolpe.evaluate(preds, np.array([0, 1, 2, 3]))
+
+
+def test_classification_accepts_integral_floats():
+    result = segerstolpe.evaluate(np.array([0.0, 1.0, 2.0, 3.0]), np.array([0, 1, 2, 3]))
+    assert result['accuracy'] == 1.0
@@ -0,0 +1,124 @@
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from genbio.leaderboard import reporting
+
+
+@pytest.fixture
+def submission_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, 'SUBMISSION_DIR', tmp_path)
+    return tmp_path
+
+
+def _write_submission(root, user, timestamp, metrics, name='run', dataset='ds'):
+    """Write a submission file the way the stdlib-json code path did."""
+    directory = root / dataset / '0' / user
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{timestamp.replace(':', '')}.json"
+    path.write_text(json.dumps({
+        'timestamp': timestamp,
+        'user': user,
+        'dataset': dataset,
+        'fold': '0',
+        'metrics': metrics,
+        'name': name,
+        'description': '',
+    }, indent=2))
+    return path
+
+
+def test_reads_nan_written_by_stdlib_json(submission_dir, tmp_path_factory):
+    _write_submission(submission_dir, 'alice', '2024-01-01T00:00:00', {'primary_metric': 'spearman', 'spearman': float('nan'), 'mse': 1.0})
+    _write_submission(submission_dir, 'alice', '2024-01-02T00:00:00', {'primary_metric': 'spearman', 'spearman': 0.5, 'mse': 0.5})
+
+    submissions = reporting.load_submissions('ds', '0')
+    assert [submission['metrics']['mse'] for submission in submissions] == [1.0, 0.5]
+
+    output = tmp_path_factory.mktemp('export') / 'export.csv'
+    reporting.export_benchmark_data(str(output))
+    assert pd.read_csv(output)['metric_mse'].tolist() == [1.0, 0.5]
+
+
+def test_non_finite_metrics_saved_as_null(submission_dir, capsys):
+    for spearman in (0.25, float('nan'), float('inf'), 0.5):
+        reporting.save_submission('ds', '0', 'alice', {'primary_metric': 'spearman', 'spearman': spearman, 'mse': 1.0}, 'run', '')
+
+    # Both JSON backends must write strict JSON, with null for the non-finite values
+    def reject(token):
+        raise ValueError(token)
+    saved = [json.loads(path.read_text(), parse_constant=reject) for path in sorted(submission_dir.rglob('*.json'))]
+    assert [submission['metrics']['spearman'] for submission in saved] == [0.25, None, None, 0.5]
+
+    leaderboard = reporting.get_leaderboard_data('ds', '0')
+    assert leaderboard[0]['metrics']['spearman'] == 0.5
+
+    reporting.display_leaderboard('ds', '0')
+    reporting.display_history('ds', '0', 'alice')
+    output = capsys.readouterr().out
+    assert 'First submission:  0.250000' in output
+    assert 'Total improvement: +0.250000' in output
+
+
+def test_index_tracks_files_changed_on_disk(submission_dir):
+    reporting.save_submission('ds', '0', 'alice', {'primary_metric': 'spearman', 'spearman': 0.1}, 'saved', '')
+    old = _write_submission(submission_dir, 'bob', '2024-01-01T00:00:00', {'primary_metric': 'spearman', 'spearman': 0.2}, 'added')
+    assert sorted(s['name'] for s in reporting.load_submissions('ds', '0')) == ['added', 'saved']
+
+    old.unlink()
+    assert [s['name'] for s in reporting.load_submissions('ds', '0')] == ['saved']
+    assert reporting.reindex() == 1
+
+
+def test_failed_save_leaves_no_file(submission_dir, monkeypatch):
+    reporting.save_submission('ds', '0', 'alice', {'primary_metric': 'spearman', 'spearman': 0.1}, 'first', '')
+
+    def fail(conn, submissions):
+        raise sqlite3.OperationalError('disk I/O error')
+    with monkeypatch.context() as patch:
+        patch.setattr(reporting, '_insert_index_rows', fail)
+        with pytest.raises(sqlite3.OperationalError):
+            reporting.save_submission('ds', '0', 'alice', {'primary_metric': 'spearman', 'spearman': 0.2}, 'second', '')
+
+    assert len(list(submission_dir.rglob('*.json'))) == 1
+    assert [s['name'] for s in reporting.load_submissions('ds', '0')] == ['first']
+
+
+def test_concurrent_v1_migration(submission_dir):
+    v1_dir = submission_dir / reporting._V1_SUBDIR
+    for i in range(50):
+        _write_submission(v1_dir, f'user{i}', '2024-01-01T00:00:00', {'primary_metric': 'spearman', 'spearman': i / 50})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: reporting.load_submissions('ds', '0'), range(8)))
+
+    assert all(len(submissions) == 50 for submissions in results)
+    assert not (submission_dir / reporting._V1_SUBDIR.parts[0]).exists()
+    assert len(list((submission_dir / 'ds' / '0').glob('*/*.json'))) == 50
+
+
+
+def test_query_does_not_scan_unrelated_datasets(submission_dir, monkeypatch):
+    for i in range(20):
+        _write_submission(submission_dir, f'user{i}', '2024-01-01T00:00:00', {'primary_metric': 'spearman', 'spearman': 0.2}, dataset='other')
+    reporting.save_submission('ds', '0', 'alice', {'primary_metric': 'spearman', 'spearman': 0.1}, 'saved', '')
+
+    scanned = []
+    real_scandir = os.scandir
+    with monkeypatch.context() as patch:
+        patch.setattr(os, 'scandir', lambda path='.': scanned.append(str(path)) or real_scandir(path))
+        patch.setattr(reporting, '_read_json', lambda path: pytest.fail(f'read {path}'))
+
+        # Neither queries nor saves on ds look at other's files, even once those changed on disk
+        _write_submission(submission_dir, 'user0', '2024-01-02T00:00:00', {'primary_metric': 'spearman', 'spearman': 0.3}, dataset='other')
+        assert len(reporting.load_submissions('ds', '0')) == 1
+        reporting.save_submission('ds', '0', 'bob', {'primary_metric': 'spearman', 'spearman': 0.3}, 'saved', '')
+        assert len(reporting.get_leaderboard_data('ds', '0')) == 2
+    assert not [path for path in scanned if path.startswith(str(submission_dir / 'other'))]
+
+    # The unrelated change is picked up when its own dataset is queried
+    assert len(reporting.load_submissions('other', '0')) == 21
@@ -0,0 +1,67 @@
+import http.server
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import anndata
+import numpy as np
+import pandas as pd
+import pytest
+
+import genbio.datasets.expression.cell_type_classification_segerstolpe.load as segerstolpe
+
+
+@pytest.fixture
+def file_server(tmp_path):
+    """Serve a small file over local HTTP, yielding its URL and contents."""
+    content = bytes(range(256)) * 4096
+    (tmp_path / 'data.h5ad').write_bytes(content)
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(tmp_path), **kwargs)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/data.h5ad", content
+    server.shutdown()
+    server.server_close()
+
+
+def test_concurrent_downloads_share_cache(file_server, tmp_path_factory):
+    url, content = file_server
+    cache_dir = tmp_path_factory.mktemp('cache')
+    dest = cache_dir / 'data.h5ad'
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: segerstolpe._download(url, dest), range(8)))
+
+    assert dest.read_bytes() == content
+    assert [path.name for path in cache_dir.iterdir()] == ['data.h5ad']
+
+
+def test_failed_download_leaves_no_files(file_server, tmp_path_factory):
+    url, _ = file_server
+    cache_dir = tmp_path_factory.mktemp('cache')
+    with pytest.raises(Exception):
+        segerstolpe._download(url.replace('data.h5ad', 'missing.h5ad'), cache_dir / 'data.h5ad')
+    assert list(cache_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize('categorical', [False, True])
+def test_load_labels_only_round_trips(tmp_path, categorical):
+    labels = np.array([3, 0, 12, 3, 7])
+    column = pd.Categorical(labels) if categorical else labels
+    obs = pd.DataFrame({'cell_type_label': column}, index=[f'cell{i}' for i in range(len(labels))])
+    path = tmp_path / 'data.h5ad'
+    anndata.AnnData(X=np.ones((len(labels), 2), dtype=np.float32), obs=obs).write_h5ad(path)
+
+    adata = segerstolpe._load_labels_only(path)
+    assert adata.obs['cell_type_label'].dtype == np.int8
+    np.testing.assert_array_equal(adata.obs['cell_type_label'].values, labels)
+    assert list(adata.obs.index) == list(obs.index)
+    # Anything beyond the labels falls through to the full AnnData
+    assert adata.X.shape == (len(labels), 2)